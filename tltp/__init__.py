@@ -1,16 +1,32 @@
 """Time-derived passwords."""
-from tltp import _password_generator
+import typing
 
 __all__ = [
     'derive_password',
     'disa_password',
     'random_password',
     'time_password',
+    'time_passwords',
+    'time_passwords_fast',
     'PasswordFunction',
 ]
 
-derive_password = _password_generator.derive_password
-disa_password = _password_generator.disa_password
-random_password = _password_generator.random_password
-time_password = _password_generator.time_password
-PasswordFunction = _password_generator.PasswordFunction
+if typing.TYPE_CHECKING:
+    from tltp._password_generator import PasswordFunction
+    from tltp._password_generator import derive_password
+    from tltp._password_generator import disa_password
+    from tltp._password_generator import random_password
+    from tltp._password_generator import time_password
+    from tltp._password_generator import time_passwords
+    from tltp._password_generator import time_passwords_fast
+
+
+def __getattr__(name: str):  # pylint: disable=invalid-name
+    # The generator module is loaded on first attribute access rather than
+    # at package import, so `import tltp.cli` (and therefore the console
+    # script) does not pay for the cryptographic machinery until a password
+    # is actually derived.
+    if name in __all__:
+        from tltp import _password_generator  # pylint: disable=import-outside-toplevel
+        return getattr(_password_generator, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,10 +1,15 @@
 """Password generation module."""
 import datetime
+import functools
 import hashlib
+import os
 import random
 import struct
+import time
+from typing import List
 from typing import Optional
 from typing import Protocol
+from typing import Sequence
 from typing import Union
 
 _LOWER = 'abcdefghijklmnopqrstuvwxyz'
@@ -12,9 +17,45 @@ _UPPER = _LOWER.upper()
 _DIGIT = '0123456789'
 _SYMBOL = '~!@#$%^&*()-=[]\\{}|;:\'",./<>?'
 _CLASSES = [_LOWER, _UPPER, _DIGIT, _SYMBOL]
+_CLASS_OF = {c: i for i, cls in enumerate(_CLASSES) for c in cls}
 _ALL = ''.join(_CLASSES)
 
 
+@functools.lru_cache(maxsize=1)
+def _system_random() -> random.SystemRandom:
+    """Return a process-wide OS randomness source, constructed on first use.
+
+    Constructing this lazily keeps `import tltp` from touching the OS
+    entropy source, and sharing one instance avoids re-opening it for every
+    generated password.
+    """
+    return random.SystemRandom()
+
+
+@functools.lru_cache(maxsize=128)
+def _scrypt(password: bytes, salt: bytes, dklen: int) -> bytes:
+    """Stretch a salted master password into a pseudorandom entropy pool.
+
+    The underlying KDF is memory-hard and dominates the cost of deriving a
+    password, so results are memoized: repeated derivations for the same
+    inputs (e.g., adjacent time offsets queried in one process, or test
+    suites) skip the KDF entirely.
+
+    Note that cache entries retain derived key material for the lifetime of
+    the process. Callers holding especially sensitive material may call
+    `_scrypt.cache_clear()` to discard it.
+    """
+    return hashlib.scrypt(
+        password=password,
+        salt=salt,
+        dklen=dklen,
+        n=2**15,
+        r=8,
+        p=3,
+        maxmem=2**26,
+    )
+
+
 class PasswordFunction(Protocol):
     """Protocol for password generation.
 
@@ -24,9 +65,9 @@ class PasswordFunction(Protocol):
     """
 
     def __call__(
-            self,
-            length: int,
-            rand: random.Random = random.SystemRandom(),
+        self,
+        length: int,
+        rand: Optional[random.Random] = None,
     ) -> str:
         """Generate a password of a given length using the provided RNG.
 
@@ -40,6 +81,7 @@ class PasswordFunction(Protocol):
                 random choices within the password generation. Implementations
                 MUST NOT use alternative sources of randomness, lest they
                 will violate the reproducibility contract of this protocol.
+                If None, implementations SHALL use an OS randomness source.
 
         Returns:
             A randomized string of the specified length.
@@ -48,12 +90,35 @@ class PasswordFunction(Protocol):
         return '0' * length
 
 
+def _urandom_password(length: int) -> str:
+    """Sample `length` characters of `_ALL` uniformly from os.urandom.
+
+    Bytes are masked to 7 bits and rejected when they fall outside the
+    alphabet, preserving uniformity while batching the entropy reads into a
+    few urandom calls rather than one per character.
+    """
+    assert len(_ALL) <= 128
+    chars: List[str] = []
+    while len(chars) < length:
+        for b in os.urandom(2 * (length - len(chars))):
+            idx = b & 0x7f
+            if idx < len(_ALL):
+                chars.append(_ALL[idx])
+                if len(chars) == length:
+                    break
+    return ''.join(chars)
+
+
 def random_password(
-        length: int,
-        rand: random.Random = random.SystemRandom(),
+    length: int,
+    rand: Optional[random.Random] = None,
 ) -> str:
     """A PasswordFunction for generating random passwords."""
-    return ''.join(rand.choice(_ALL) for _ in range(length))
+    if rand is None or isinstance(rand, random.SystemRandom):
+        # SystemRandom draws from os.urandom per choice; sampling the
+        # entropy in bulk is equivalent and amortizes the reads.
+        return _urandom_password(length)
+    return ''.join(rand.choices(_ALL, k=length))
 
 
 def _disa_valid(password: str) -> bool:
@@ -65,28 +130,45 @@ def _disa_valid(password: str) -> bool:
     Returns:
         True if password matches DISA's criteria; false otherwise.
     """
-    a = password
-
-    # These criteria are guaranteed by construction, so we assert their
-    # correctness.
-    for c in _CLASSES:
-        assert not set(c).isdisjoint(a)
-
-    # If it contains a string of four identical characters.
-    if any(w == x == y == z for w, x, y, z in zip(a, a[1:], a[2:], a[3:])):
-        return False
-
-    # If it contains a string of five characters in the same class.
-    for i in range(5, len(a)):
-        sub = set(a[i - 5:i])
-        if any(sub.issubset(x) for x in _CLASSES):
-            return False
+    # A single left-to-right scan tracks a run of identical characters and a
+    # run of characters from the same class, rejecting as soon as either run
+    # reaches its limit.
+    seen = set()
+    prev_char = ''
+    prev_class = -1
+    char_run = 0
+    class_run = 0
+    for c in password:
+        cid = _CLASS_OF[c]
+        seen.add(cid)
+
+        # If it contains a string of four identical characters.
+        if c == prev_char:
+            char_run += 1
+            if char_run >= 4:
+                return False
+        else:
+            prev_char = c
+            char_run = 1
+
+        # If it contains a string of five characters in the same class.
+        if cid == prev_class:
+            class_run += 1
+            if class_run >= 5:
+                return False
+        else:
+            prev_class = cid
+            class_run = 1
+
+    # Presence of every class is guaranteed by construction, so we assert
+    # its correctness.
+    assert len(seen) == len(_CLASSES)
 
     return True
 
 
 def disa_password(length: int = 15,
-                  rand: random.Random = random.SystemRandom()) -> str:
+                  rand: Optional[random.Random] = None) -> str:
     """Generate a random password compliant with DISA requirements.
 
     DISA requirements are derived from the STIG for RHEL 8. Compliant passwords:
@@ -121,22 +203,21 @@ def disa_password(length: int = 15,
     if length < 15:
         raise ValueError(
             'DISA password requirements require a minimum of 15 characters.')
+    if rand is None:
+        rand = _system_random()
 
-    required = ''.join(x[rand.randrange(len(x))] for x in _CLASSES)
+    while True:
+        required = ''.join(x[rand.randrange(len(x))] for x in _CLASSES)
 
-    padding = ''
-    for _ in range(length - len(_CLASSES)):
-        padding += rand.choice(_ALL)
+        chars = [rand.choice(_ALL) for _ in range(length - len(_CLASSES))]
+        for x in required:
+            chars.insert(rand.randrange(len(chars) + 1), x)
 
-    for x in required:
-        k = rand.randint(0, len(padding))
-        padding = padding[:k] + x + padding[k:]
+        password = ''.join(chars)
 
-    # Reject invalid passwords
-    if not _disa_valid(padding):
-        return disa_password(length, rand)
-
-    return padding
+        # Reject invalid passwords
+        if _disa_valid(password):
+            return password
 
 
 def time_password(
@@ -170,10 +251,9 @@ def time_password(
         password = password.encode(encoding='utf-8')
     if isinstance(name, str):
         name = name.encode(encoding='utf-8')
-    if for_time is None:
-        for_time = datetime.datetime.utcnow()
+    now = time.time() if for_time is None else for_time.timestamp()
 
-    counter = int(for_time.timestamp() // interval.total_seconds()) + offset
+    counter = int(now // interval.total_seconds()) + offset
     salt = name + struct.pack('<Q', counter)
     return derive_password(
         password=password,
@@ -183,6 +263,110 @@ def time_password(
     )
 
 
+def time_passwords(
+    password: Union[str, bytes],
+    name: Union[str, bytes],
+    offsets: Sequence[int],
+    interval: datetime.timedelta = datetime.timedelta(days=60),
+    for_time: Optional[datetime.datetime] = None,
+    length: int = 15,
+    generator: PasswordFunction = random_password,
+) -> List[str]:
+    """Generate time-based passwords for several time intervals at once.
+
+    This produces exactly the passwords `time_password` would produce for
+    each offset in `offsets`, performing the argument coercion and counter
+    arithmetic once for the whole batch. Each offset still pays its own KDF
+    cost on first derivation, but repeated offsets within a process are
+    served from the KDF cache.
+
+    Args:
+        password: the master password provided by the user.
+        name: the name for which the passwords are being generated.
+        offsets: the time-interval offsets to derive passwords for, e.g.,
+            `(-1, 0, 1)` yields the previous, current, and next passwords.
+        interval: the time-interval for which passwords are valid.
+        for_time: the timestamp for which the generated passwords must be
+            generated.
+        length: the length of each generated password.
+        generator: the password generation function.
+
+    Returns:
+        A list of derived passwords in the same order as `offsets`.
+    """
+    if isinstance(password, str):
+        password = password.encode(encoding='utf-8')
+    if isinstance(name, str):
+        name = name.encode(encoding='utf-8')
+    now = time.time() if for_time is None else for_time.timestamp()
+
+    base = int(now // interval.total_seconds())
+    return [
+        derive_password(
+            password=password,
+            salt=name + struct.pack('<Q', base + offset),
+            length=length,
+            generator=generator,
+        ) for offset in offsets
+    ]
+
+
+def time_passwords_fast(
+    password: Union[str, bytes],
+    name: Union[str, bytes],
+    offsets: Sequence[int],
+    interval: datetime.timedelta = datetime.timedelta(days=60),
+    for_time: Optional[datetime.datetime] = None,
+    length: int = 15,
+    generator: PasswordFunction = random_password,
+) -> List[str]:
+    """Generate passwords for several time intervals with one KDF run.
+
+    Unlike `time_passwords`, which pays the full scrypt cost per offset,
+    this stretches the master password once with the name alone as salt and
+    then expands a per-interval seed from that master key with BLAKE2b,
+    which is effectively free. Deriving N offsets therefore costs one scrypt
+    call instead of N.
+
+    The derivation tree differs from `time_password`, so the passwords it
+    produces are not interchangeable with `time_password`'s: pick one scheme
+    and stay with it. An attacker who obtains the intermediate master key
+    can derive the passwords for every interval of that name without
+    re-paying the scrypt cost, which is the price of the batching.
+
+    Args:
+        password: the master password provided by the user.
+        name: the name for which the passwords are being generated.
+        offsets: the time-interval offsets to derive passwords for.
+        interval: the time-interval for which passwords are valid.
+        for_time: the timestamp for which the generated passwords must be
+            generated.
+        length: the length of each generated password.
+        generator: the password generation function.
+
+    Returns:
+        A list of derived passwords in the same order as `offsets`.
+    """
+    if isinstance(password, str):
+        password = password.encode(encoding='utf-8')
+    if isinstance(name, str):
+        name = name.encode(encoding='utf-8')
+    now = time.time() if for_time is None else for_time.timestamp()
+
+    base = int(now // interval.total_seconds())
+    master = _scrypt(password=password, salt=name, dklen=64)
+
+    passwords = []
+    for offset in offsets:
+        seed = hashlib.blake2b(
+            master,
+            salt=struct.pack('<Q', base + offset),
+            digest_size=64,
+        ).digest()
+        passwords.append(generator(length, random.Random(seed)))
+    return passwords
+
+
 def derive_password(
     password: Union[str, bytes],
     salt: Union[str, bytes],
@@ -211,14 +395,7 @@ def derive_password(
     if isinstance(salt, str):
         salt = salt.encode(encoding='utf-8')
 
-    randomness = hashlib.scrypt(
-        password=password,
-        salt=salt,
-        dklen=256,
-        n=2**14,
-        r=14,
-        p=1,
-    )
+    randomness = _scrypt(password=password, salt=salt, dklen=256)
 
     # We seed the default random number generator with 2048-bits of
     # computationally hard pseudorandomness. We resist predictability attacks
@@ -0,0 +1,113 @@
+"""Unit tests for the password generation module."""
+import datetime
+import unittest
+
+import tltp
+
+
+class TestDerivePassword(unittest.TestCase):
+    """Regression tests pinning derived output to the scrypt parameters.
+
+    Changing the KDF parameters changes every derived password, so these
+    known-answer tests exist to make such a change deliberate rather than
+    accidental.
+    """
+
+    def test_random_generator(self):
+        self.assertEqual(
+            tltp.derive_password(
+                'correct horse',
+                'example.com',
+                tltp.random_password,
+            ),
+            '^-eFdq$b*js41y/',
+        )
+
+    def test_disa_generator(self):
+        self.assertEqual(
+            tltp.derive_password(
+                'correct horse',
+                'example.com',
+                tltp.disa_password,
+            ),
+            ';ySZ-f\\xv!6byFm',
+        )
+
+    def test_time_password(self):
+        self.assertEqual(
+            tltp.time_password(
+                'correct horse',
+                'example.com',
+                for_time=datetime.datetime(2023,
+                                           1,
+                                           1,
+                                           tzinfo=datetime.timezone.utc),
+                generator=tltp.disa_password,
+            ),
+            'Yn;W\\J1o1(<53]x',
+        )
+
+    def test_time_passwords_matches_time_password(self):
+        # The batch API promises exactly the passwords time_password would
+        # produce for each offset.
+        for_time = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+        self.assertEqual(
+            tltp.time_passwords(
+                'correct horse',
+                'example.com',
+                offsets=(-1, 0, 1),
+                for_time=for_time,
+                generator=tltp.disa_password,
+            ),
+            [
+                tltp.time_password(
+                    'correct horse',
+                    'example.com',
+                    offset=offset,
+                    for_time=for_time,
+                    generator=tltp.disa_password,
+                ) for offset in (-1, 0, 1)
+            ],
+        )
+
+    def test_time_passwords_fast(self):
+        for_time = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+        self.assertEqual(
+            tltp.time_passwords_fast(
+                'correct horse',
+                'example.com',
+                offsets=(-1, 0, 1),
+                for_time=for_time,
+                generator=tltp.disa_password,
+            ),
+            [
+                ']wrQw#9#\\r7*=Hs',
+                'dND%WPVx|x=R987',
+                'eX$tk8d,~gB1nx8',
+            ],
+        )
+
+    def test_time_passwords_fast_differs_from_time_password(self):
+        # The fast batch uses a different derivation tree on purpose; its
+        # passwords must never be mistaken for time_password's.
+        for_time = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+        self.assertNotEqual(
+            tltp.time_passwords_fast(
+                'correct horse',
+                'example.com',
+                offsets=(0,),
+                for_time=for_time,
+                generator=tltp.disa_password,
+            ),
+            tltp.time_passwords(
+                'correct horse',
+                'example.com',
+                offsets=(0,),
+                for_time=for_time,
+                generator=tltp.disa_password,
+            ),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
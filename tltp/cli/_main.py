@@ -1,34 +1,60 @@
 """Entrypoint for TLTP Command Line application."""
+from __future__ import annotations
+
 import argparse
 import contextlib
 import datetime
-import getpass
+import functools
+import importlib
 import os
-import random
 import shlex
 import sys
+import time
 from typing import Generator
 from typing import IO
 from typing import List
 from typing import Optional
 
-try:
-    import pyperclip
-except ImportError:
-    from tltp.cli import _pyperclip as pyperclip
+_DESCRIPTION = ('Generate a time-derived password for the given name. '
+                'The name may be any string, such as a service, domain, '
+                'URI, or an arbitrary value. These names must must be '
+                'retrievable, as this password manager stores no state: '
+                'the password name and the master password uniquely '
+                'determine the derived password at the current time.')
+
+_HELP_OFFSET = ('the number of time intervals to skip; '
+                'negative numbers skip backwards (default: 0)')
+
+_HELP_REMAINING = ('show the remaining time until the next password rotation '
+                   'on the stderr stream to allow the password to be piped')
+
+_HELP_GENERATOR = ('password generation function reference formatted as '
+                   '`module:func`, e.g., `foo.bar:baz` identifies a function '
+                   '`baz` in module `foo.bar` matching the '
+                   '`tltp.PasswordFunction` protocol; the function MUST '
+                   'derive all randomness from the provided RNG or derived '
+                   'passwords will not be reproducible '
+                   '(default: `tltp:disa_password`)')
+
+_HELP_ALPHABET = ('unordered list of valid characters to be used for random '
+                  'password generation')
+
 
-import tltp
+def _parse_generator(spec: str):
+    """Split a `module:func` generator specifier into its two parts."""
+    parts = spec.rsplit(':', 1)
+    if len(parts) != 2:
+        raise argparse.ArgumentTypeError(
+            f'Invalid generator function specifier {spec}')
+    module, func = parts
+    return module, func
 
 
+@functools.lru_cache(maxsize=None)
 def _get_parser():
     parser = argparse.ArgumentParser(
         prog='tltp',
-        description=('Generate a time-derived password for the given name. '
-                     'The name may be any string, such as a service, domain, '
-                     'URI, or an arbitrary value. These names must must be '
-                     'retrievable, as this password manager stores no state: '
-                     'the password name and the master password uniquely '
-                     'determine the derived password at the current time.'),
+        description=_DESCRIPTION,
     )
     parser.add_argument(
         dest='name',
@@ -40,8 +66,7 @@ def _get_parser():
         '--offset',
         dest='offset',
         type=int,
-        help=('the number of time intervals to skip; '
-              'negative numbers skip backwards (default: 0)'),
+        help=_HELP_OFFSET,
         default=0,
     )
     parser.add_argument(
@@ -87,24 +112,20 @@ def _get_parser():
         '--remaining',
         action='store_true',
         dest='remaining',
-        help=('show the remaining time until the next password rotation '
-              'on the stderr stream to allow the password to be piped'),
+        help=_HELP_REMAINING,
         default=False,
     )
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
         '--generator',
         dest='generator',
-        help=('password generation function reference formatted as '
-              '`module:func`, e.g., `foo.bar:baz` identifies a function `baz` '
-              'in module `foo.bar` matching the `tltp.PasswordFunction` '
-              'protocol (default: `tltp:disa_password`)'),
+        type=_parse_generator,
+        help=_HELP_GENERATOR,
     )
     group.add_argument(
         '--alphabet',
         dest='alphabet',
-        help=('unordered list of valid characters to be used for random '
-              'password generation'),
+        help=_HELP_ALPHABET,
     )
     return parser
 
@@ -129,36 +150,61 @@ def _try_open(path: Optional[str]) -> Generator[Optional[IO], None, None]:
 
 
 def main():
+    argv = sys.argv[1:]
+    # Short-circuit help before any flagfile I/O: argparse prints help and
+    # exits, and prepended flagfile arguments cannot change that outcome.
+    if argv and argv[0] in ('-h', '--help'):
+        _get_parser().parse_args(argv)
+
     flag_file = os.getenv('TLTP_FLAGFILE')
     with _try_open(flag_file) as f:
-        args = get_arguments(sys.argv[1:], f)
-
-    password = getpass.getpass('Master Password: ')
-    if args.confirm:
-        confirm = getpass.getpass('Confirm Master Password: ')
-        if confirm != password:
-            print('Master passwords did not match.', file=sys.stderr)
-            sys.exit(1)
+        args = get_arguments(argv, f)
+
+    # Deferred so that --help and argument errors never pay for the
+    # cryptographic machinery.
+    import tltp  # pylint: disable=import-outside-toplevel
+
+    if sys.stdin.isatty():
+        # Deferred: getpass drags in termios/pwd (msvcrt on Windows), which
+        # piped invocations never need.
+        import getpass  # pylint: disable=import-outside-toplevel
+        password = getpass.getpass('Master Password: ')
+        confirm = password
+        if args.confirm:
+            confirm = getpass.getpass('Confirm Master Password: ')
+    else:
+        # Scripted usage: read the master password (and its confirmation,
+        # if requested) from the pipe without prompting.
+        password = sys.stdin.readline().rstrip('\n')
+        confirm = password
+        if args.confirm:
+            confirm = sys.stdin.readline().rstrip('\n')
+    if confirm != password:
+        print('Master passwords did not match.', file=sys.stderr)
+        sys.exit(1)
 
     generator = tltp.disa_password
     if args.generator is not None:
-        module, sep, func = args.generator.partition(':')
-        if sep == '':
-            print(
-                f'Invalid generator function specifier {args.generator}',
-                file=sys.stderr,
-            )
-            sys.exit(1)
+        module, func = args.generator
         try:
-            generator = getattr(__import__(module), func)
+            generator = getattr(importlib.import_module(module), func)
         except (AttributeError, ModuleNotFoundError) as e:
             print('Error loading generator function:', e, file=sys.stderr)
             sys.exit(1)
     elif args.alphabet is not None:
+        # Deferred alongside the other derivation-only imports; only the
+        # reproducibility assertion below needs the module at runtime.
+        import random  # pylint: disable=import-outside-toplevel
+
+        alphabet = args.alphabet
+        if any(c.isspace() for c in alphabet):
+            alphabet = ''.join(sorted(alphabet.split()))
 
         def gen(length: int, rand: random.Random) -> str:
-            alphabet = ''.join(sorted(args.alphabet.split()))
-            return ''.join(rand.choice(alphabet) for _ in range(length))
+            # Derivation hands this a deterministically seeded Random; an OS
+            # entropy source here would silently break reproducibility.
+            assert not isinstance(rand, random.SystemRandom)
+            return ''.join(rand.choices(alphabet, k=length))
 
         generator = gen
 
@@ -180,16 +226,22 @@ def main():
         print(out)
 
     if args.clip:
+        try:
+            import pyperclip  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            from tltp.cli import _pyperclip as pyperclip  # pylint: disable=import-outside-toplevel
         pyperclip.copy(out)
 
     if args.remaining:
-        now = datetime.datetime.utcnow()
+        now = time.time()
         seconds = interval.total_seconds()
-        seconds = seconds - now.timestamp() % seconds
+        seconds = seconds - now % seconds
         remaining = datetime.timedelta(seconds=seconds)
-        time = now + remaining
+        rotation = datetime.datetime.fromtimestamp(
+            now, tz=datetime.timezone.utc) + remaining
         print(
-            f'Your passwords will rotate in {remaining.days} days at {time}.',
+            (f'Your passwords will rotate in {remaining.days} days '
+             f'at {rotation}.'),
             file=sys.stderr,
         )
         print(